@@ -8,7 +8,7 @@ from __future__ import annotations
 import typing
 from collections import UserList
 from dataclasses import dataclass
-from itertools import filterfalse, tee
+from itertools import filterfalse, islice, tee
 from typing import (
     Callable,
     Dict,
@@ -114,6 +114,8 @@ class KeyValue(Generic[A_co]):
     Simple dataclass for storing key-value pairs.
     """
 
+    __slots__ = ("key", "value")
+
     key: str
     value: A_co
 
@@ -162,7 +164,11 @@ class Sequence(MonadPlus[A_co], typing.Sequence[A_co]):
         return len(self.get)
 
     def __or__(self, other: "Sequence[A]") -> "Sequence[A_co | A]":  # type: ignore[override]
-        return Sequence([*self, *other])
+        if not other:
+            return self
+        if not self:
+            return other
+        return _Concat(self, other)
 
     def __add__(self, other: "Sequence[A]") -> "Sequence[A_co | A]":
         return self | other
@@ -242,8 +248,13 @@ class Sequence(MonadPlus[A_co], typing.Sequence[A_co]):
         {'a': ['b', {'b': ['c', {'c': [1, 2]}]}]}
         """
 
+        colliding = self.to_colliding_dict()
+        if not any(isinstance(v, (_Colliding, _TreePath)) for v in colliding.values()):
+            # the common case: every key was bound once, to a plain value
+            return cast("Dict[str, A | List[A]]", colliding)
+
         def get_dict():
-            for k, v in self.to_colliding_dict().items():
+            for k, v in colliding.items():
                 if isinstance(v, _Colliding):
                     other, paths = _partition(lambda x: isinstance(x, _TreePath), v)
                     other = list(other)
@@ -267,7 +278,140 @@ class Sequence(MonadPlus[A_co], typing.Sequence[A_co]):
 
     @classmethod
     def zero(cls: Type["Sequence[A_co]"]) -> "Sequence[A_co]":
-        return Sequence([])
+        """
+        Every call shares one empty instance, backed by a tuple so that it cannot be
+        mutated through its ``get``.
+
+        >>> Sequence.zero() is Sequence.zero()
+        True
+        >>> Sequence.zero().get
+        ()
+        """
+        return _EMPTY_SEQUENCE
+
+
+_EMPTY_SEQUENCE: Sequence = Sequence(())
+
+
+class _Concat(Sequence[A_co]):
+    """
+    The concatenation of two sequences, which is only copied into a list when its
+    elements are first accessed. This prevents repeated concatenation (e.g. by
+    :py:meth:`Parser.many <dollar_lambda.parsers.Parser.many>`) from copying the
+    accumulated output at every step.
+
+    >>> from dollar_lambda import Sequence
+    >>> s = Sequence([1]) + Sequence([2]) + Sequence([3])
+    >>> s
+    Sequence(get=[1, 2, 3])
+    >>> s == Sequence([1, 2, 3])
+    True
+    """
+
+    def __init__(self, left: Sequence[A_co], right: Sequence[A_co]):
+        self.left: Optional[Sequence[A_co]] = left
+        self.right: Optional[Sequence[A_co]] = right
+        self._get: Optional[List[A_co]] = None
+
+    def __bool__(self) -> bool:
+        # both operands are nonempty (see Sequence.__or__), so avoid flattening
+        return True
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence):
+            return list(self.get) == list(other.get)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(Sequence(self.get))
+
+    @property
+    def get(self) -> List[A_co]:  # type: ignore[override]
+        if self._get is None:
+            # flatten iteratively, since long chains of concatenations would exceed the recursion limit
+            get: List[A_co] = []
+            stack: List[Sequence[A_co]] = [self]
+            while stack:
+                s = stack.pop()
+                if isinstance(s, _Concat) and s._get is None:
+                    assert s.left is not None and s.right is not None
+                    stack.extend((s.right, s.left))
+                else:
+                    get.extend(s.get)
+            self._get, self.left, self.right = get, None, None
+        return self._get
+
+
+class _Cursor(Sequence[A_co]):
+    """
+    A suffix of the input to a parser, represented as a position in a shared tuple
+    so that consuming a word does not copy the rest of the input. All suffixes of the
+    same input share ``memo``, which :py:meth:`Parser.parse <dollar_lambda.parsers.Parser.parse>`
+    uses to memoize results by parser and position (unless it is ``None``).
+
+    >>> from dollar_lambda.data_structures import _Cursor
+    >>> cs = _Cursor(("a", "b", "c"), memo={})
+    >>> cs[1:]
+    Sequence(get=['b', 'c'])
+    >>> cs[1:] == Sequence(["b", "c"])
+    True
+    >>> cs[1:][0], len(cs[1:]), list(cs[1:][1:])
+    ('b', 2, ['c'])
+    >>> cs[1:].memo is cs.memo
+    True
+    """
+
+    def __init__(
+        self, tokens: typing.Tuple[A_co, ...], pos: int = 0, memo: Optional[dict] = None
+    ):
+        self.tokens = tokens
+        self.pos = pos
+        self.memo = memo
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence):
+            return list(self.get) == list(other.get)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(Sequence(self.get))
+
+    @classmethod
+    def from_words(
+        cls, words: typing.Iterable[str], memoize: bool = True
+    ) -> "_Cursor[str]":
+        """
+        Builds a cursor over the words of a command line. Words are not interned:
+        strings interned with :py:func:`sys.intern` are never freed on some versions of
+        CPython, and matching a word does not depend on its identity.
+        """
+        return _Cursor(tuple(words), memo={} if memoize else None)
+
+    @property
+    def get(self) -> List[A_co]:  # type: ignore[override]
+        return list(self.tokens[self.pos :])
+
+    @overload
+    def __getitem__(self, i: int) -> "A_co":
+        ...
+
+    @overload
+    def __getitem__(self, i: slice) -> "Sequence[A_co]":
+        ...
+
+    def __getitem__(self, i: "int | slice") -> "A_co | Sequence[A_co]":
+        if isinstance(i, int):
+            return self.tokens[self.pos + i] if i >= 0 else self.get[i]
+        if i.step is None and i.stop is None and (i.start or 0) >= 0:
+            pos = min(self.pos + (i.start or 0), len(self.tokens))
+            return _Cursor(self.tokens, pos, self.memo)
+        return Sequence(self.get[i])
+
+    def __iter__(self) -> Generator[A_co, None, None]:
+        yield from islice(self.tokens, self.pos, None)
+
+    def __len__(self) -> int:
+        return len(self.tokens) - self.pos
 
 
 A_co_monoid = TypeVar("A_co_monoid", covariant=True, bound=Monoid)
@@ -4,22 +4,20 @@ and the :py:class:`CommandTree<dollar_lambda.decorators.CommandTree>` class.
 """
 from __future__ import annotations
 
-import operator
 import sys
 import typing
-from dataclasses import MISSING, dataclass, field, replace
-from functools import reduce
+from dataclasses import MISSING, dataclass, field
 from inspect import Parameter, signature
-from typing import Any, Callable, Iterator, List, Optional, Type, TypeVar
+from typing import Any, Callable, List, Optional, Tuple, Type, TypeVar
 
 from pytypeclass import Monoid
 from pytypeclass.nonempty_list import NonemptyList
 
 from dollar_lambda import parsers
 from dollar_lambda.args import _ArgsField
-from dollar_lambda.data_structures import KeyValue, Output, Sequence
+from dollar_lambda.data_structures import KeyValue, Output, Sequence, _Cursor
 from dollar_lambda.errors import ArgumentError
-from dollar_lambda.parsers import Parse, Parser, matches
+from dollar_lambda.parsers import Parse, Parser, _choice, matches
 from dollar_lambda.result import Result
 
 A = TypeVar("A")
@@ -341,7 +339,7 @@ class _FunctionPair(Monoid[A_co]):
         p = eq >= (
             lambda _: Parser[Output[_FunctionPair[str]]](g, usage=usage, helps=_help)
         )
-        return replace(p, usage=eq.usage, helps=eq.helps)
+        return p._replace(usage=eq.usage, helps=eq.helps)
 
     @classmethod
     def zero(cls: Type[Monoid[A]]) -> Monoid[A]:
@@ -359,6 +357,10 @@ class _Node:
     replace_underscores: bool
     subcommand: bool
     tree: Optional["CommandTree"]
+    _variable_names: Tuple[str, ...] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._variable_names = tuple(signature(self.function).parameters)
 
     def parser(self, *exclude: str) -> Parser[Output[_FunctionPair[Any]]]:
         p1: Parser[Output[_FunctionPair[str]]] = (
@@ -377,8 +379,8 @@ class _Node:
         )
         return p1 >> p2
 
-    def variable_names(self) -> Iterator[str]:
-        yield from signature(self.function).parameters.keys()
+    def variable_names(self) -> Tuple[str, ...]:
+        return self._variable_names
 
 
 @dataclass
@@ -518,21 +520,19 @@ class CommandTree:
                 "You must assign children to a CommandTree object in order to use it as a parser."
             )
 
-        def get_alternatives() -> Iterator[Parser[Output[_FunctionPair[Any]]]]:
-            for child in self._children:
-                parser: Parser[Output[_FunctionPair[Any]]] = child.parser(*variables)
-                if child.tree is not None and child.tree._children:
-                    child_parser = child.tree._parser(
-                        *variables, *child.variable_names()
+        alternatives: List[Parser[Output[_FunctionPair[Any]]]] = []
+        for child in self._children:
+            parser: Parser[Output[_FunctionPair[Any]]] = child.parser(*variables)
+            if child.tree is not None and child.tree._children:
+                child_parser = child.tree._parser(*variables, *child.variable_names())
+                if child.can_run:
+                    child_parser = (
+                        child_parser | Parser[Output[_FunctionPair[Any]]].done()
                     )
-                    if child.can_run:
-                        child_parser = (
-                            child_parser | Parser[Output[_FunctionPair[Any]]].done()
-                        )
-                    parser = parser >> child_parser
-                yield parser
+                parser = parser >> child_parser
+            alternatives.append(parser)
 
-        return reduce(operator.or_, get_alternatives()).wrap_help()
+        return _choice(*alternatives).wrap_help()
 
     def __call__(self, *args: str) -> Any:
         """
@@ -543,7 +543,7 @@ class CommandTree:
         """
         _args = args if args or parsers.TESTING else sys.argv[1:]
         p = self._parser() >> Parser[Output[_FunctionPair[Any]]].done()
-        result = p.parse(Sequence(list(_args))).get
+        result = p.parse(_Cursor.from_words(_args)).get
         if isinstance(result, ArgumentError):
             return p.handle_error(result)
         assert isinstance(result, NonemptyList)
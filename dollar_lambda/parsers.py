@@ -11,25 +11,28 @@ import operator
 import os
 import re
 import sys
-from dataclasses import _MISSING_TYPE, MISSING, astuple, dataclass, replace
-from functools import partial, reduce
+from dataclasses import _MISSING_TYPE, MISSING, dataclass, field
+from functools import lru_cache, partial, reduce, wraps
 from typing import (
     Any,
     Callable,
     Collection,
     Dict,
     Generic,
-    Iterable,
+    Iterator,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
+    cast,
+    get_origin,
 )
 
 from pytypeclass import Monad, MonadPlus, Monoid
 from pytypeclass.nonempty_list import NonemptyList
 
-from dollar_lambda.data_structures import KeyValue, Output, Sequence, _TreePath
+from dollar_lambda.data_structures import KeyValue, Output, Sequence, _Cursor, _TreePath
 from dollar_lambda.errors import (
     ArgumentError,
     BinaryError,
@@ -38,17 +41,21 @@ from dollar_lambda.errors import (
     UnequalError,
     UnexpectedError,
 )
-from dollar_lambda.result import Result
+from dollar_lambda.result import Result, _concat, _from_list, _to_list
 
 TESTING = os.environ.get("DOLLAR_LAMBDA_TESTING", False)
 PRINTING = os.environ.get("DOLLAR_LAMBDA_PRINTING", True)
 MAX_MANY = int(os.environ.get("DOLLAR_LAMBDA_MAX_MANY", 80))
+_HELP_PREFIXES = ("--help", "-h")
+_REGEX_SPECIAL = frozenset(".^$*+?{}[]\\|()")
+_CACHE_SIZE = 1024
 
 A_co = TypeVar("A_co", covariant=True)
 A_monoid = TypeVar("A_monoid", bound=Monoid)
 B_monoid = TypeVar("B_monoid", bound=Monoid)
 A = TypeVar("A")
 B = TypeVar("B")
+F = TypeVar("F", bound=Callable[..., Any])
 
 
 @dataclass
@@ -67,6 +74,8 @@ class Parse(Generic[A_co]):
 
     """
 
+    __slots__ = ("parsed", "unparsed")
+
     parsed: A_co
     unparsed: Sequence[str]
 
@@ -81,11 +90,61 @@ def binary_usage(a: Optional[str], op: str, b: Optional[str], add_brackets=True)
     """
     Utility for generating usage strings for binary operators.
     """
-    no_nones = [x for x in (a, b) if x is not None]
-    usage = op.join(no_nones)
-    if len(no_nones) > 1 and add_brackets:
-        usage = f"[{usage}]"
-    return usage or None
+    if a is None:
+        return b or None
+    if b is None:
+        return a or None
+    usage = a + op + b
+    return f"[{usage}]" if add_brackets else usage or None
+
+
+def _cacheable(value: Any) -> bool:
+    if type(value) in (str, bool, type(None)):
+        return True
+    # classes of this package (e.g. ``cls`` of :py:meth:`Parser.done`) live as long
+    # as the module does, so the cache may hold them
+    cls = get_origin(value) or value
+    return isinstance(cls, type) and cls.__module__.startswith("dollar_lambda.")
+
+
+def _copy(parser: "Parser[A_co]") -> "Parser[A_co]":
+    nonoptional = parser.nonoptional
+    return parser._replace(
+        helps=dict(parser.helps),
+        nonoptional=None if nonoptional is None else _copy(nonoptional),
+    )
+
+
+def _cache(factory: F) -> F:
+    """
+    Like ``lru_cache(maxsize=_CACHE_SIZE)``, but keeps the signature of ``factory``
+    for type checkers. Only calls whose arguments are all strings, bools, ``None`` or
+    classes of this package are cached; any other argument (e.g. ``default``,
+    ``choices`` or ``type``) builds an uncached parser, so that the process-wide cache
+    never holds on to a caller's objects. :py:class:`Parser` is mutable, so each call
+    returns its own copy of the cached parser, down through its ``nonoptional``
+    parsers.
+
+    >>> from dollar_lambda import flag, option
+    >>> flag("x") == flag("x")
+    True
+    >>> flag("x") is flag("x")
+    False
+    >>> option("x", default=[1.0]).parse_args()
+    {'x': [1.0]}
+    >>> option("x", default=[1]).parse_args()
+    {'x': [1]}
+    """
+
+    cached: Callable[..., Parser] = lru_cache(maxsize=_CACHE_SIZE)(factory)
+
+    @wraps(factory)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if all(map(_cacheable, args)) and all(map(_cacheable, kwargs.values())):
+            return _copy(cached(*args, **kwargs))
+        return factory(*args, **kwargs)
+
+    return cast(F, wrapper)
 
 
 @dataclass
@@ -98,6 +157,11 @@ class Parser(MonadPlus[A_co]):
     usage: Optional[str]
     helps: Dict[str, str]
     nonoptional: Optional["Parser[A_co]"] = None
+    _parse_args_parsers: Optional[
+        Dict[
+            Tuple[bool, bool], Tuple["Parser", Optional[str], Dict[str, str], "Parser"]
+        ]
+    ] = field(default=None, init=False, repr=False, compare=False)
 
     def __add__(
         self: "Parser[Output[A_monoid]]", other: "Parser[Output[B_monoid]]"
@@ -139,7 +203,7 @@ class Parser(MonadPlus[A_co]):
         """
         p = (self >> other) | (other >> self)
         usage = binary_usage(self.usage, " ", other.usage, add_brackets=False)
-        return replace(p, usage=usage)
+        return p._replace(usage=usage)
 
     def __ge__(self, f: Callable[[A_co], Monad[B_monoid]]) -> "Parser[B_monoid]":  # type: ignore[override]
         """Sugar for :py:meth:`Parser.bind <dollar_lambda.parsers.Parser.bind>`."""
@@ -171,6 +235,13 @@ class Parser(MonadPlus[A_co]):
 
         >>> p.parse_args("--verbose", "--option", "x", allow_unparsed=True)
         {'verbose': True}
+
+        Both parsers are always applied, even if the first succeeds, since a later parser
+        may only succeed on the unparsed remainder of the second:
+
+        >>> p = flag("a") | (flag("a") >> flag("b"))
+        >>> p.parse_args("-a", "-b")
+        {'a': True, 'b': True}
         """
 
         def f(cs: Sequence[str]) -> Result[Parse["A_monoid | B_monoid"]]:
@@ -260,13 +331,27 @@ class Parser(MonadPlus[A_co]):
                 -d
         """
 
-        def f(p1: Output[A_monoid]) -> Parser[Output[A_monoid | B_monoid]]:
-            def g(p2: Output[B_monoid]) -> Parser[Output[A_monoid | B_monoid]]:
-                return Parser.return_(p1 + p2)
-
-            return p >= g
+        def f(cs: Sequence[str]) -> Result[Parse[Output[A_monoid | B_monoid]]]:
+            # equivalent to self >= (lambda p1: p >= (lambda p2: Parser.return_(p1 + p2)))
+            # without building two intermediate parsers for every parse of self
+            result = self.parse(cs)
+            if isinstance(result.get, ArgumentError):
+                return result
+            first: Optional[Result[Parse[Output[B_monoid]]]] = None
+            parses: List[Parse[Output[A_monoid | B_monoid]]] = []
+            for parse1 in _to_list(result.get):
+                result2 = p.parse(parse1.unparsed)
+                if first is None:
+                    first = result2
+                if isinstance(result2.get, NonemptyList):
+                    for parse2 in _to_list(result2.get):
+                        parses.append(
+                            Parse(parse1.parsed + parse2.parsed, parse2.unparsed)
+                        )
+            assert first is not None
+            return Result(_from_list(parses)) if parses else first
 
-        parser = self >= f
+        parser = Parser(f, usage=None, helps={})
         op = " "
         if self.usage is None:
             prefix = ""
@@ -279,12 +364,12 @@ class Parser(MonadPlus[A_co]):
 
         if p.usage is not None and "\n" in p.usage:
             op = f"\n"
-            p = replace(
-                p, usage="\n".join(prefix + line for line in p.usage.split("\n"))
+            p = p._replace(
+                usage="\n".join(prefix + line for line in p.usage.split("\n"))
             )
 
         usage = binary_usage(self.usage, op, p.usage, add_brackets=False)
-        return replace(parser, usage=usage, helps={**self.helps, **p.helps})
+        return parser._replace(usage=usage, helps={**self.helps, **p.helps})
 
     def __xor__(
         self: "Parser[Output[A_monoid]]", other: "Parser[Output[B_monoid]]"
@@ -328,20 +413,30 @@ class Parser(MonadPlus[A_co]):
         {'hello': [True, True]}
         """
 
-        def g(a: A_monoid) -> Parser[B_monoid]:
-            try:
-                y = f(a)
-            except Exception as e:
-                usage = f"An argument {a}: raised exception {e}"
-                y = Result(ArgumentError(usage))
-            return Parser(
-                lambda cs: y >= (lambda parsed: Result.return_(Parse(parsed, cs))),
-                usage=self.usage,
-                helps=self.helps,
-            )
-
-        p = self >= g
-        return replace(p, usage=self.usage, helps=self.helps)
+        def g(cs: Sequence[str]) -> Result[Parse[B_monoid]]:
+            # equivalent to binding self to a parser that returns f's output, without
+            # building that parser for every parse of self
+            result = self.parse(cs).get
+            if isinstance(result, ArgumentError):
+                return Result(result)
+            error: Optional[ArgumentError] = None
+            parses: List[Parse[B_monoid]] = []
+            for parse in _to_list(result):
+                try:
+                    y = f(parse.parsed)
+                except Exception as e:
+                    usage = f"An argument {parse.parsed}: raised exception {e}"
+                    y = Result(ArgumentError(usage))
+                if isinstance(y.get, ArgumentError):
+                    error = y.get if error is None else error
+                else:
+                    parses.extend([Parse(a, parse.unparsed) for a in _to_list(y.get)])
+            if parses:
+                return Result(_from_list(parses))
+            assert error is not None
+            return Result(error)
+
+        return Parser(g, usage=self.usage, helps=self.helps)
 
     def bind(self, f: Callable[[A_co], Monad[B_monoid]]) -> "Parser[B_monoid]":  # type: ignore[override]
         """
@@ -389,9 +484,10 @@ class Parser(MonadPlus[A_co]):
     def defaults(
         self: "Parser[Output[Sequence[KeyValue[A]]]]", **kwargs
     ) -> "Parser[Output[Sequence[KeyValue[A]]]]":
-        return replace(self | defaults(**kwargs), nonoptional=self)
+        return (self | defaults(**kwargs))._replace(nonoptional=self)
 
     @classmethod
+    @_cache
     def done(
         cls: Type["Parser[Output[A_monoid]]"], a: Optional[Type[A_monoid]] = None
     ) -> Parser[Output[Any]]:
@@ -418,17 +514,20 @@ class Parser(MonadPlus[A_co]):
         Unrecognized argument: --quiet
         """
 
+        zero = Output.zero(a)
+
         def f(cs: Sequence[str]) -> Result[Parse[Output[Any]]]:
             if cs:
-                c, *_ = cs
+                c = cs[0]
                 return Result(
                     UnexpectedError(unexpected=c, usage=f"Unrecognized argument: {c}")
                 )
-            return Result(NonemptyList(Parse(parsed=Output.zero(a), unparsed=cs)))
+            return Result(NonemptyList(Parse(parsed=zero, unparsed=cs)))
 
         return Parser(f, usage=None, helps={})
 
     @classmethod
+    @_cache
     def empty(
         cls: Type["Parser[Output[A_monoid]]"], a: Optional[Type[A_monoid]] = None
     ) -> "Parser[Output[A_monoid]]":
@@ -452,10 +551,12 @@ class Parser(MonadPlus[A_co]):
         Parser unexpectedly succeeded.
         """
 
+        zero = Output.zero(a)
+
         def g(cs: Sequence[str]) -> Result[Parse[Output[A_monoid]]]:
             parse = self.parse(cs).get
             if isinstance(parse, Exception):
-                return Result.return_(Parse(Output.zero(a), cs))
+                return Result.return_(Parse(zero, cs))
             else:
                 return Result.zero(
                     error=SuccessError(
@@ -491,11 +592,21 @@ class Parser(MonadPlus[A_co]):
         An argument Output(get=Sequence(get=[KeyValue(key='a', value=True)])): raised exception expected string or bytes-like object
         """
 
+        compiled: Optional["re.Pattern[str]"] = None
+        try:
+            compiled = re.compile(pattern)
+        except re.error:
+            # leave invalid patterns to re.findall, which reports them as parse errors
+            pass
+
         def f(
             out: Output[Sequence[KeyValue[str]]],
         ) -> Result[Output[Sequence[KeyValue[str]]]]:
             *tail, kv = out.get
-            matches = re.findall(pattern, kv.value)
+            if compiled is None:
+                matches = re.findall(pattern, kv.value)
+            else:
+                matches = compiled.findall(kv.value)
             return Result.return_(
                 Output(Sequence(tail + [KeyValue(kv.key, m) for m in matches]))
             )
@@ -503,15 +614,17 @@ class Parser(MonadPlus[A_co]):
         return self.apply(f)
 
     def handle_error(self, error: ArgumentError) -> None:
+        # collect the message and print it with a single call
+        lines: List[str] = []
+
         def print_usage(usage: str):
             usage_str = "usage:"
-            self._print(usage_str, end="\n" if "\n" in usage else " ")
             if "\n" in usage:
-                usage = "\n".join([" " * len(usage_str) + u for u in usage.split("\n")])
-            self._print(usage)
-            if self.helps:
-                for k, v in self.helps.items():
-                    self._print(f"{k}: {v}")
+                lines.append(usage_str)
+                lines.extend([" " * len(usage_str) + u for u in usage.split("\n")])
+            else:
+                lines.append(f"{usage_str} {usage}")
+            lines.extend([f"{k}: {v}" for k, v in self.helps.items()])
 
         if isinstance(error, HelpError):
             print_usage(error.usage)
@@ -519,7 +632,9 @@ class Parser(MonadPlus[A_co]):
             if self.usage:
                 print_usage(self.usage)
             if error.usage:
-                self._print(error.usage)
+                lines.append(error.usage)
+        if lines:
+            self._print("\n".join(lines))
         if TESTING:
             return
         else:
@@ -546,8 +661,10 @@ class Parser(MonadPlus[A_co]):
         The following arguments are required: --hello
         """
 
+        zero = Output.zero(a)
+
         def g(keep: Parse[Output[A_monoid]]) -> Result[Parse[Output[A_monoid]]]:
-            return Result(NonemptyList(Parse(Output.zero(a), keep.unparsed)))
+            return Result(NonemptyList(Parse(zero, keep.unparsed)))
 
         def f(cs: Sequence[str]) -> Result[Parse[Output[A_monoid]]]:
             return self.parse(cs) >= g
@@ -590,6 +707,12 @@ class Parser(MonadPlus[A_co]):
         >>> p = p.many()
         >>> p.parse_args("--verbose", "--quiet") # mix --verbose and --quiet
         {'verbose': True, 'quiet': True}
+
+        Long inputs do not hit the recursion limit:
+
+        >>> p = argument("x").many(max=2000)
+        >>> len(p.parse_args(*map(str, range(1500)))["x"])
+        1500
         """
         if max == 0:
             p = self.empty()
@@ -597,7 +720,7 @@ class Parser(MonadPlus[A_co]):
             max -= 1
             assert max >= 0, max
             p = self.many1(max=max) | self.empty()
-        return replace(p, usage=f"[{self.usage} ...]")
+        return p._replace(usage=f"[{self.usage} ...]")
 
     def many1(
         self: "Parser[Output[A_monoid]]", max: int = MAX_MANY
@@ -628,11 +751,46 @@ class Parser(MonadPlus[A_co]):
         The following arguments are required: 1-or-more
         """
 
-        return Parser(
-            lambda cs: (self >> self.many(max=max)).parse(cs),
-            usage=f"{self.usage} [{self.usage} ...]",
-            helps=self.helps,
-        )
+        def successes(cs: Sequence[str], n: int) -> Iterator[Parse[Output[A_monoid]]]:
+            parses = self.parse(cs).get if n > 0 else None
+            return (
+                iter(_to_list(parses)) if isinstance(parses, NonemptyList) else iter(())
+            )
+
+        def f(cs: Sequence[str]) -> Result[Parse[Output[A_monoid]]]:
+            # Equivalent to (self >> self.many(max=max)).parse(cs), but walks the
+            # repetitions depth-first with an explicit stack instead of building
+            # a new parser for each one.
+            result = self.parse(cs)
+            heads = result.get
+            if isinstance(heads, ArgumentError):
+                return result
+            heads_list = _to_list(heads)
+
+            def parses() -> Iterator[Parse[Output[A_monoid]]]:
+                for head in heads_list:
+                    stack = [
+                        (head.parsed, head.unparsed, successes(head.unparsed, max))
+                    ]
+                    while stack:
+                        parsed, unparsed, tails = stack[-1]
+                        tail = next(tails, None)
+                        if tail is None:
+                            stack.pop()
+                            yield Parse(parsed, unparsed)
+                        else:
+                            n = max - len(stack)
+                            stack.append(
+                                (
+                                    parsed + tail.parsed,
+                                    tail.unparsed,
+                                    successes(tail.unparsed, n),
+                                )
+                            )
+
+            return Result(_from_list(list(parses())))
+
+        return Parser(f, usage=f"{self.usage} [{self.usage} ...]", helps=self.helps)
 
     def map_error(self, f: Callable[[ArgumentError], ArgumentError]) -> "Parser[A_co]":
         def g(cs: Sequence[str]) -> Result[Parse[A_co]]:
@@ -683,18 +841,18 @@ class Parser(MonadPlus[A_co]):
             d = out.get
             if not d:
                 raise RuntimeError("Invoked nested on a parser that returns no output.")
-            *tail, head = out.get
+            kvs = d.get
+            head = kvs[-1]
             if "." in head.key:
-                key, hd, *tl = head.key.split(".")
-                parents = NonemptyList.make(hd, *tl)
+                key, parents = _key_path(head.key)
                 path = _TreePath(parents, head.value)
                 kv = KeyValue(key, path)
-                return Result.return_(Output(Sequence([*tail, kv])))
+                return Result.return_(Output(Sequence([*kvs[:-1], kv])))
             else:
                 return Result.return_(out)
 
         p = self.apply(g)
-        return replace(p, usage=self.usage, helps=self.helps)
+        return p._replace(usage=self.usage, helps=self.helps)
 
     def optional(self: "Parser[Output[A_monoid]]") -> "Parser[Output[A_monoid]]":
         """
@@ -710,19 +868,31 @@ class Parser(MonadPlus[A_co]):
         usage: --optional
         Expected '--optional'. Got '--misspelled'
         """
-        return replace(self | self.empty(), nonoptional=self)
+        return (self | self.empty())._replace(nonoptional=self)
 
     def parse(self, cs: Sequence[str]) -> Result[Parse[A_co]]:
         """
         Applies the parser to the input sequence ``cs``.
+
+        When ``cs`` is the input to :py:meth:`Parser.parse_args` (or a suffix of it)
+        and ``packrat`` is true, results are memoized by parser and position, so
+        backtracking combinators like :py:meth:`| <Parser.__or__>` and
+        :py:func:`nonpositional` never apply the same parser to the same position twice.
         """
-        return self.f(cs)
+        if not isinstance(cs, _Cursor) or cs.memo is None:
+            return self.f(cs)
+        key = (id(self), cs.pos)
+        if key not in cs.memo:
+            # store self alongside the result so that its id cannot be reused
+            cs.memo[key] = (self, self.f(cs))
+        return cs.memo[key][1]
 
     def parse_args(
         self: "Parser[Output]",
         *args: str,
         allow_unparsed: bool = False,
         check_help: bool = True,
+        packrat: bool = True,
     ) -> "Optional[Dict[str, Any]]":
         """
         The main way the user extracts parsed results from the parser.
@@ -737,6 +907,11 @@ class Parser(MonadPlus[A_co]):
         check_help : bool
             Before running the parser, checks if the input string is ``--help`` or ``-h``.
             If it is, returns the usage message.
+        packrat : bool
+            Memoize the result of applying each parser at each position of the input.
+            This does not change the result, but it prevents parsers that backtrack a lot
+            (e.g. :py:func:`nonpositional`) from repeating work. Grammars that never
+            backtrack may parse slightly faster with this disabled.
 
         Examples
         --------
@@ -745,23 +920,42 @@ class Parser(MonadPlus[A_co]):
         usage: A
         >>> argument("a").parse_args("--help")
         usage: A
+        >>> p = nonpositional(flag("x"), flag("y"), option("z"))
+        >>> p.parse_args("-y", "-z", "1", "-x", packrat=False)
+        {'y': True, 'z': '1', 'x': True}
         """
         _args = args if args or TESTING else sys.argv[1:]
-        if not allow_unparsed:
-            return (self >> Parser[Output].done()).parse_args(
-                *_args,
-                allow_unparsed=True,
-                check_help=check_help,
-            )
-        if check_help:
-            return self.wrap_help().parse_args(
-                *_args,
-                allow_unparsed=allow_unparsed,
-                check_help=False,
-            )
-        result = self.parse(Sequence(list(_args))).get
+        # wrap_help only intervenes when the first word is a help flag
+        check_help = (
+            check_help
+            and bool(_args)
+            and isinstance(_args[0], str)
+            and _args[0].startswith(_HELP_PREFIXES)
+        )
+        parser: Parser[Output] = self
+        if not allow_unparsed or check_help:
+            # reuse the wrapped parser, unless it was built for another parser (e.g.
+            # the original of a copy) or the usage and helps it copied have changed
+            if self._parse_args_parsers is None:
+                self._parse_args_parsers = {}
+            key = (allow_unparsed, check_help)
+            cached = self._parse_args_parsers.get(key)
+            if (
+                cached is None
+                or cached[0] is not self
+                or cached[1] != self.usage
+                or cached[2] != self.helps
+            ):
+                if not allow_unparsed:
+                    parser = parser >> Parser[Output].done()
+                if check_help:
+                    parser = parser.wrap_help()
+                cached = (self, self.usage, dict(self.helps), parser)
+                self._parse_args_parsers[key] = cached
+            parser = cached[3]
+        result = parser.parse(_Cursor.from_words(_args, memoize=packrat)).get
         if isinstance(result, ArgumentError):
-            self.handle_error(result)
+            parser.handle_error(result)
             return None
         get = result.head.parsed.get
         assert isinstance(get, Sequence), get
@@ -772,6 +966,26 @@ class Parser(MonadPlus[A_co]):
         if PRINTING:
             print(*args, **kwargs)
 
+    def _replace(self, **changes: Any) -> "Parser[A_co]":
+        """
+        Equivalent to :py:func:`dataclasses.replace`, without its per-call inspection
+        of the dataclass fields.
+
+        >>> argument("x")._replace(usgae="X")
+        Traceback (most recent call last):
+        ...
+        TypeError: _replace() got unexpected fields: ['usgae']
+        """
+        unexpected = changes.keys() - {"f", "usage", "helps", "nonoptional"}
+        if unexpected:
+            raise TypeError(f"_replace() got unexpected fields: {sorted(unexpected)}")
+        return Parser(
+            changes.get("f", self.f),
+            usage=changes.get("usage", self.usage),
+            helps=changes.get("helps", self.helps),
+            nonoptional=changes.get("nonoptional", self.nonoptional),
+        )
+
     @classmethod
     def return_(cls, a: A_co) -> "Parser[A_co]":  # type: ignore[misc]
         # see https://github.com/python/mypy/issues/6178#issuecomment-1057111790
@@ -841,16 +1055,18 @@ class Parser(MonadPlus[A_co]):
             d = out.get
             if not d:
                 raise RuntimeError("Invoked type on a parser that returns no output.")
-            *tail, head = out.get
+            # only the last binding changes, so avoid unpacking the whole output
+            kvs = d.get
+            head = kvs[-1]
             try:
                 y = f(head.value)
             except Exception as e:
                 usage = f"argument {head.value}: raised exception {e}"
                 return Result(ArgumentError(usage))
-            return Result.return_(Output(Sequence([*tail, KeyValue(head.key, y)])))
+            return Result.return_(Output(Sequence([*kvs[:-1], KeyValue(head.key, y)])))
 
         p = self.apply(g)
-        return replace(p, usage=self.usage, helps=self.helps)
+        return p._replace(usage=self.usage, helps=self.helps)
 
     def wrap_error(self, error: ArgumentError) -> "Parser[A_co]":
         return self.map_error(lambda _: error)
@@ -882,7 +1098,7 @@ class Parser(MonadPlus[A_co]):
         Expected 'subcommand1'. Got 'subcommand2'
         """
         p = _help_parser(self.usage, Output.zero(a)) >= (lambda _: self)
-        return replace(p, usage=self.usage, helps=self.helps)
+        return p._replace(usage=self.usage, helps=self.helps)
 
     @classmethod
     def zero(cls, error: Optional[ArgumentError] = None) -> "Parser[A_co]":
@@ -929,7 +1145,7 @@ def apply(f: Callable[[str], B_monoid], description: str) -> Parser[B_monoid]:
     """
 
     def g(out: Output[Sequence[KeyValue[str]]]) -> Result[B_monoid]:
-        *_, (_, v) = map(astuple, out.get)
+        v = out.get[-1].value
         assert v is not None  # because item produces output
         try:
             y = f(v)
@@ -941,6 +1157,7 @@ def apply(f: Callable[[str], B_monoid], description: str) -> Parser[B_monoid]:
     return item(description).apply(g)
 
 
+@_cache
 def argument(
     dest: str,
     nesting: bool = True,
@@ -998,10 +1215,30 @@ def argument(
     if nesting:
         parser = parser.nesting()
     helps = {dest: help} if help else {}
-    parser = replace(parser, usage=dest.upper(), helps=helps)
+    parser = parser._replace(usage=dest.upper(), helps=helps)
     return parser
 
 
+def _choice(*parsers: Parser[A_monoid]) -> Parser[A_monoid]:
+    """
+    Equivalent to ``reduce(operator.or_, parsers)``, but builds a single parser
+    instead of one intermediate :py:meth:`| <Parser.__or__>` node per alternative.
+    """
+    head, *tail = parsers
+    if not tail:
+        return head
+
+    def f(cs: Sequence[str]) -> Result[Parse[A_monoid]]:
+        return _concat([p.parse(cs) for p in parsers])
+
+    usage = head.usage
+    helps = dict(head.helps)
+    for p in tail:
+        usage = binary_usage(usage, " | ", p.usage)
+        helps.update(p.helps)
+    return Parser(f, usage=usage, helps=helps)
+
+
 def defaults(**kwargs: A) -> Parser[Output[Sequence[KeyValue[A]]]]:
     """
     Useful for assigning default values to arguments.
@@ -1031,12 +1268,31 @@ def defaults(**kwargs: A) -> Parser[Output[Sequence[KeyValue[A]]]]:
     >>> p.parse_args("-x", "1", "-y", "2", "--verbose")
     {'x': 1, 'y': 2, 'verbose': True, 'quiet': False}
     """
-    p = Parser[Output[A_monoid]].return_(
+    # the output is built once here and shared by every parse
+    return Parser[Output[A_monoid]].return_(
         Output[Sequence[KeyValue[A]]].from_dict(**kwargs)
     )
-    return replace(p, usage=None)
 
 
+def _flat_defaults(
+    alternatives: List[Parser[Output[Sequence[KeyValue[A]]]]],
+    dest: str,
+    default: A,
+    usage: Optional[str],
+    helps: Dict[str, str],
+) -> Parser[Output[Sequence[KeyValue[A]]]]:
+    """
+    Equivalent to ``_choice(*alternatives).defaults(**{dest: default})`` with ``usage``
+    and ``helps`` replaced, but builds one flat choice instead of nesting the
+    alternatives inside another :py:meth:`| <Parser.__or__>`.
+    """
+    parser = _choice(*alternatives)._replace(usage=usage, helps=helps)
+    return _choice(*alternatives, defaults(**{dest: default}))._replace(
+        usage=usage, helps=helps, nonoptional=parser
+    )
+
+
+@_cache
 def flag(
     dest: str,
     default: "bool | _MISSING_TYPE" = MISSING,
@@ -1144,41 +1400,42 @@ def flag(
     else:
         _string = string
 
-    def f(
-        cs: Sequence[str],
-        s: str,
-    ) -> Result[Parse[Output[Sequence[KeyValue[bool]]]]]:
-        _defaults = defaults(**{dest: True if default is MISSING else not default})
-        if nesting:
-            _defaults = _defaults.nesting()
-
-        parser = matches(s, regex=regex) >= (lambda _: _defaults)
-        return parser.parse(cs)
-
-    parser = Parser(partial(f, s=_string), usage=None, helps={})
-    if string is None and short and len(dest) > 1:
-        short_string = f"-{dest[0]}"
-        parser2 = flag(dest, short=False, string=short_string, default=default)
-        parser = parser | parser2
+    _defaults = defaults(**{dest: True if default is MISSING else not default})
+    if nesting:
+        _defaults = _defaults.nesting()
+
+    alternatives = [matches(_string, regex=regex) >= (lambda _: _defaults)]
+    has_short = string is None and short and len(dest) > 1
+    if has_short:
+        # the short form always uses the default nesting and regex
+        short_defaults = _defaults if nesting else _defaults.nesting()
+        alternatives.append(matches(f"-{dest[0]}") >= (lambda _: short_defaults))
     if default is not MISSING:
         help = f"{help + ' ' if help else ''}(default: {default})"
     helps = {dest: help} if help else {}
-    parser = replace(parser, usage=_string, helps=helps)
-    return parser if default is MISSING else parser.defaults(**{dest: default})
+    if isinstance(default, _MISSING_TYPE):
+        return _choice(*alternatives)._replace(usage=_string, helps=helps)
+    if has_short:
+        # the short form carries its own default alternative, which stays in
+        # nonoptional and which nonpositional relies on
+        alternatives.append(defaults(**{dest: default}))
+    return _flat_defaults(alternatives, dest, default, usage=_string, helps=helps)
 
 
 def _help_parser(usage: Optional[str], parsed: A_monoid) -> Parser[A_monoid]:
     def f(
         cs: Sequence[str],
     ) -> Result[Parse[A_monoid]]:
-        result = (matches("--help", peak=True) | matches("-h", peak=True)).parse(cs)
-        if isinstance(result.get, ArgumentError):
-            return Result.return_(Parse(parsed=parsed, unparsed=cs))
-        return Result(HelpError(usage=usage or "Usage not provided."))
+        # equivalent to matches("--help", peak=True) | matches("-h", peak=True),
+        # which match any word starting with one of these strings
+        if cs and isinstance(cs[0], str) and cs[0].startswith(_HELP_PREFIXES):
+            return Result(HelpError(usage=usage or "Usage not provided."))
+        return Result.return_(Parse(parsed=parsed, unparsed=cs))
 
     return Parser(f, usage=None, helps={})
 
 
+@_cache
 def item(
     name: str,
     usage_name: Optional[str] = None,
@@ -1207,14 +1464,12 @@ def item(
 
     def f(cs: Sequence[str]) -> Result[Parse[Output[Sequence[KeyValue[str]]]]]:
         if cs:
-            head, *tail = cs
+            head = cs[0]
             return Result(
                 NonemptyList(
                     Parse(
-                        parsed=Output[Sequence[KeyValue[str]]].from_dict(
-                            **{name: head}
-                        ),
-                        unparsed=Sequence(tail),
+                        parsed=Output(Sequence([KeyValue(name, head)])),
+                        unparsed=cs[1:],
                     )
                 )
             )
@@ -1228,6 +1483,22 @@ def item(
     return Parser(f, usage=name, helps={})
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
+def _key_path(key: str) -> Tuple[str, NonemptyList[str]]:
+    """
+    Splits a dotted key into its first component and the path below it, for
+    :py:meth:`Parser.nesting`. Keys come from a grammar's fixed set of destinations,
+    so each one is split once.
+
+    >>> from dollar_lambda.parsers import _key_path
+    >>> _key_path("a.b.c")
+    ('a', ['b', 'c'])
+    """
+    key, hd, *tl = key.split(".")
+    return key, NonemptyList.make(hd, *tl)
+
+
+@_cache
 def matches(
     s: str, peak: bool = False, regex: bool = True
 ) -> Parser[Output[Sequence[KeyValue[str]]]]:
@@ -1275,28 +1546,43 @@ def matches(
     {'hello': ['hello', 'hello'], 'goodbye': 'goodbye'}
     """
 
-    def predicate(_s: str) -> bool:
-        if regex:
-            return bool(re.match(s, _s))
-        else:
-            return s == _s
-
-    if peak:
-        return sat_peak(
-            predicate=predicate,
-            on_fail=lambda _s: UnequalError(
-                left=s, right=_s, usage=f"Expected '{s}'. Got '{_s}'"
-            ),
-            name=s,
-        )
+    s = sys.intern(s)
+    # choose the test once, rather than branching on regex for every word
+    predicate: Callable[[str], Any]
+    if not regex:
+        predicate = partial(operator.eq, s)
+    elif _REGEX_SPECIAL.isdisjoint(s):
+        # re.match of a pattern with no special characters is a prefix test
+        predicate = operator.methodcaller("startswith", s)
     else:
-        return sat(
-            predicate=predicate,
-            on_fail=lambda _s: UnequalError(
-                left=s, right=_s, usage=f"Expected '{s}'. Got '{_s}'"
-            ),
-            name=s,
-        )
+        try:
+            predicate = re.compile(s).match
+        except re.error:
+            # leave invalid patterns to re.match, which reports them as parse errors
+            predicate = partial(re.match, s)
+
+    def f(cs: Sequence[str]) -> Result[Parse[Output[Sequence[KeyValue[str]]]]]:
+        # equivalent to sat(predicate, on_fail, name=s) (or sat_peak if peak), without
+        # the intermediate item/apply/bind parsers
+        if not cs:
+            return Result(
+                MissingError(
+                    missing=s, usage=f"The following arguments are required: {s}"
+                )
+            )
+        _s = cs[0]
+        parsed = Output(Sequence([KeyValue(s, _s)]))
+        try:
+            success = predicate(_s)
+        except Exception as e:
+            return Result(ArgumentError(f"An argument {parsed}: raised exception {e}"))
+        if not success:
+            return Result(
+                UnequalError(left=s, right=_s, usage=f"Expected '{s}'. Got '{_s}'")
+            )
+        return Result.return_(Parse(parsed, cs if peak else cs[1:]))
+
+    return Parser(f, usage=s, helps={})
 
 
 def nonpositional(
@@ -1386,65 +1672,73 @@ def nonpositional(
     _parsers = [*parsers] if repeated is None else [*parsers, repeated]
     usage = sep.join([p.usage or "" for p in _parsers])
 
-    def _nonpositional(
-        parsers: "Iterable[Parser[Output[A_monoid]]]",
-        max: int = MAX_MANY,
-    ) -> "Parser[Output[A_monoid]]":
-        if not parsers:
-            return Parser[Output[A_monoid]].empty()
-
-        def get_alternatives():
-            nonoptionals = [p.nonoptional for p in parsers]
-            if all(p is not None for p in nonoptionals):
-                yield (
-                    reduce(
-                        operator.rshift,
-                        [p.fails() for p in nonoptionals if p is not None],
-                    )
-                    >> reduce(operator.rshift, parsers)
-                )
-            for i, head in enumerate(parsers):
-                tail = [p for j, p in enumerate(parsers) if j != i]
-                if repeated is not None:
-                    head = head >> repeated.many()
-
-                def f(
-                    p1: Output[A_monoid],
-                    _parsers: List[Parser[Output[A_monoid]]],
-                ) -> Parser[Output[A_monoid]]:
-
-                    p = _nonpositional(
-                        parsers=_parsers,
-                        max=max,
-                    )
-
-                    def g(p2: Output[A_monoid]) -> Parser[Output[A_monoid]]:
-                        return Parser.return_(p1 + p2)
+    heads = [*parsers] if repeated is None else [p >> repeated.many() for p in parsers]
+    nonoptionals = [p if p.nonoptional is None else p.nonoptional for p in heads]
+    fallbacks: Dict[Tuple[int, ...], Parser[Output[A_monoid]]] = {}
+
+    def fallback(remaining: Tuple[int, ...]) -> Parser[Output[A_monoid]]:
+        # if none of the remaining parsers matches, apply all of them in order
+        # so that each one can fall back to its default value
+        if remaining not in fallbacks:
+            fails = [parsers[i].nonoptional.fails() for i in remaining]  # type: ignore[union-attr]
+            fallbacks[remaining] = reduce(operator.rshift, fails) >> reduce(
+                operator.rshift, [parsers[i] for i in remaining]
+            )
+        return fallbacks[remaining]
+
+    # distinguishes this parser's entries in the packrat memo
+    memo_key = object()
+    zero: Output[A_monoid] = Output.zero()
+
+    def parse(
+        remaining: Tuple[int, ...], cs: Sequence[str]
+    ) -> Result[Parse[Output[A_monoid]]]:
+        # different orders of the same parsers often reach the same (remaining, position)
+        if isinstance(cs, _Cursor) and cs.memo is not None:
+            key = (memo_key, remaining, cs.pos)
+            if key not in cs.memo:
+                cs.memo[key] = search(remaining, cs)
+            return cs.memo[key]
+        return search(remaining, cs)
+
+    def search(
+        remaining: Tuple[int, ...], cs: Sequence[str]
+    ) -> Result[Parse[Output[A_monoid]]]:
+        if not remaining:
+            return Result.return_(Parse(zero, cs))
 
-                    return p >= g
+        def f(
+            parse1: Parse[Output[A_monoid]], tail: Tuple[int, ...]
+        ) -> Result[Parse[Output[A_monoid]]]:
+            def g(parse2: Parse[Output[A_monoid]]) -> Result[Parse[Output[A_monoid]]]:
+                return Result.return_(
+                    Parse(parse1.parsed + parse2.parsed, parse2.unparsed)
+                )
 
-                nonoptional = head if head.nonoptional is None else head.nonoptional
-                yield nonoptional >= partial(f, _parsers=tail)
+            return parse(tail, parse1.unparsed) >= g
 
-        usage = " ".join([p.usage or "" for p in parsers])
-        return replace(
-            reduce(operator.or_, get_alternatives()),
-            usage=usage,
-            helps={k: v for p in parsers for k, v in p.helps.items()},
-        )
+        results = []
+        if all(parsers[i].nonoptional is not None for i in remaining):
+            results.append(fallback(remaining).parse(cs))
+        for i in remaining:
+            tail = tuple(j for j in remaining if j != i)
+            results.append(nonoptionals[i].parse(cs) >= partial(f, tail=tail))
+        return _concat(results)
 
-    parser = _nonpositional(
-        parsers=parsers,
-        max=max,
+    parser = Parser(
+        lambda cs: parse(tuple(range(len(parsers))), cs),
+        usage=None,
+        helps={k: v for p in parsers for k, v in p.helps.items()},
     )
     if repeated is not None:
         parser = repeated.many() >> parser
     helps = parser.helps
     if repeated is not None:
         helps = {**helps, **repeated.helps}
-    return replace(parser, usage=usage, helps=helps)
+    return parser._replace(usage=usage, helps=helps)
 
 
+@_cache
 def option(
     dest: str,
     choices: Optional[Collection[Any]] = None,
@@ -1580,34 +1874,30 @@ def option(
     else:
         _flag = flag
 
-    def f(cs: Sequence[str]) -> Result[Parse[Output[Sequence[KeyValue[str]]]]]:
-        parser = matches(_flag, regex=regex) >= (
-            lambda _: argument(dest, nesting=nesting, type=type).n_times(nargs)
-        )
-        if nargs == 1:
-            parser = parser | (argument(dest).findall(f"{_flag}=(.*)").type(type))
+    assert nargs == 1 or choices is None, "choices is not supported for nargs > 1"
+    _argument = argument(dest, nesting=nesting, type=type).n_times(nargs)
+    parser = matches(_flag, regex=regex) >= (lambda _: _argument)
+    if nargs == 1:
+        parser = parser | (argument(dest).findall(f"{_flag}=(.*)").type(type))
 
-            if choices is not None:
+        if choices is not None:
 
-                def choices_type(x: Any) -> Any:
-                    assert choices is not None  # for mypy
-                    if x not in choices:
-                        raise ArgumentError(
-                            f"invalid choice: '{x}'. Choose from {choices}."
-                        )
-                    return x
-
-                parser = parser.type(choices_type)
-        else:
-            assert choices is None, "choices is not supported for nargs > 1"
-        return parser.parse(cs)
+            def choices_type(x: Any) -> Any:
+                assert choices is not None  # for mypy
+                if x not in choices:
+                    raise ArgumentError(
+                        f"invalid choice: '{x}'. Choose from {choices}."
+                    )
+                return x
 
-    parser = Parser(f, usage=None, helps={})
+            parser = parser.type(choices_type)
+    alternatives = [parser]
     if flag is None and short and len(dest) > 1:
-        parser2 = option(
-            dest=dest, short=False, flag=f"-{dest[0]}", default=MISSING, type=type
+        alternatives.append(
+            option(
+                dest=dest, short=False, flag=f"-{dest[0]}", default=MISSING, type=type
+            )
         )
-        parser = parser | parser2
     if default is not MISSING:
         help = f"{help + ' ' if help else ''}(default: {default})"
     helps = {dest: help} if help else {}
@@ -1616,10 +1906,13 @@ def option(
         if choices is None
         else "{" + f"{','.join([str(c) for c in choices])}" + "}"
     )
-    parser = replace(parser, usage=f"{_flag} {value_symbol}", helps=helps)
-    return parser if default is MISSING else parser.defaults(**{dest: default})
+    usage = f"{_flag} {value_symbol}"
+    if default is MISSING:
+        return _choice(*alternatives)._replace(usage=usage, helps=helps)
+    return _flat_defaults(alternatives, dest, default, usage=usage, helps=helps)
 
 
+@_cache
 def peak(
     name: str,
     description: Optional[str] = None,
@@ -1642,14 +1935,12 @@ def peak(
         cs: Sequence[str],
     ) -> Result[Parse[Output[Sequence[KeyValue[str]]]]]:
         if cs:
-            head, *_ = cs
+            head = cs[0]
             return Result(
                 NonemptyList(
                     Parse(
-                        parsed=Output[Sequence[KeyValue[str]]].from_dict(
-                            **{name: head}
-                        ),
-                        unparsed=Sequence(cs),
+                        parsed=Output(Sequence([KeyValue(name, head)])),
+                        unparsed=cs,
                     )
                 )
             )
@@ -1693,11 +1984,11 @@ def sat(
     """
 
     def _predicate(out: Output[Sequence[KeyValue[str]]]) -> bool:
-        *_, (_, v) = map(astuple, out.get)
+        v = out.get[-1].value
         return predicate(v)
 
     def _on_fail(out: Output[Sequence[KeyValue[str]]]) -> ArgumentError:
-        *_, (_, v) = map(astuple, out.get)
+        v = out.get[-1].value
         return on_fail(v)
 
     return item(name).sat(_predicate, _on_fail)
@@ -1714,11 +2005,11 @@ def sat_peak(
     """
 
     def _predicate(out: Output[Sequence[KeyValue[str]]]) -> bool:
-        *_, (_, v) = map(astuple, out.get)
+        v = out.get[-1].value
         return predicate(v)
 
     def _on_fail(out: Output[Sequence[KeyValue[str]]]) -> ArgumentError:
-        *_, (_, v) = map(astuple, out.get)
+        v = out.get[-1].value
         return on_fail(v)
 
     return peak(name).sat(_predicate, _on_fail)
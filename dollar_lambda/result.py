@@ -4,8 +4,7 @@ Defines the `Result` dataclass, representing success or failure, output by parse
 from __future__ import annotations
 
 from dataclasses import dataclass
-from functools import reduce
-from typing import Callable, Optional, Type, TypeVar
+from typing import Callable, List, Optional, Type, TypeVar
 
 from pytypeclass import Monad, MonadPlus, Monoid
 from pytypeclass.nonempty_list import NonemptyList
@@ -20,6 +19,47 @@ A = TypeVar("A")
 B = TypeVar("B")
 
 
+def _concat(results: List[Result[A]]) -> Result[A]:
+    """
+    Equivalent to ``reduce(operator.or_, results)``, but copies the successes of each
+    result once, instead of once per subsequent result.
+    """
+    parses: List[A] = []
+    for result in results:
+        if isinstance(result.get, NonemptyList):
+            parses.extend(_to_list(result.get))
+    if parses:
+        return Result(_from_list(parses))
+    # all of the results failed, so combine their errors
+    head, *tail = results
+    for result in tail:
+        head = head | result
+    return head
+
+
+def _from_list(xs: List[A]) -> NonemptyList[A]:
+    """
+    Equivalent to ``NonemptyList.make(*xs)``, which recurses once per element.
+    """
+    *init, last = xs
+    ys = NonemptyList(last)
+    for x in reversed(init):
+        ys = NonemptyList(x, ys)
+    return ys
+
+
+def _to_list(xs: NonemptyList[A]) -> List[A]:
+    """
+    Equivalent to ``list(xs)``, but without nesting one generator per element.
+    """
+    ys = []
+    node: Optional[NonemptyList[A]] = xs
+    while node is not None:
+        ys.append(node.head)
+        node = node.tail
+    return ys
+
+
 @dataclass
 class Result(MonadPlus[A_co]):
     get: "NonemptyList[A_co] | ArgumentError"
@@ -27,12 +67,13 @@ class Result(MonadPlus[A_co]):
     def __or__(self, other: "Result[B]") -> "Result[A_co | B]":  # type: ignore[override]
         a = self.get
         b = other.get
-        if isinstance(a, NonemptyList) and isinstance(b, NonemptyList):
-            return Result(a + b)
-
-        for get in [a, b]:
-            if isinstance(get, NonemptyList):
-                return Result(get)
+        if isinstance(a, NonemptyList):
+            if isinstance(b, NonemptyList):
+                parses: List[A_co | B] = [*_to_list(a), *_to_list(b)]
+                return Result(_from_list(parses))
+            return self
+        if isinstance(b, NonemptyList):
+            return other
         for get in [a, b]:
             if isinstance(get, HelpError):
                 return Result(get)
@@ -57,26 +98,18 @@ class Result(MonadPlus[A_co]):
         x = self.get
         if isinstance(x, ArgumentError):
             return Result(x)
-        else:
-
-            def g(acc: Result[B], new: A_co) -> Result[B]:  # type: ignore[misc]
-                y = f(new)
-                assert isinstance(y, Result), y
-                a = acc.get
-                b = y.get
-
-                if isinstance(a, NonemptyList) and isinstance(b, NonemptyList):
-                    return Result(a + b)
-
-                return next(
-                    (x for x in (acc, y) if isinstance(x.get, NonemptyList)),
-                    acc,
-                )
-
-            tail = [] if x.tail is None else list(x.tail)
-            y = f(x.head)
+        # successes are concatenated; if there are none, the first error is kept
+        first: Optional[Result[B]] = None
+        parses: List[B] = []
+        for a in _to_list(x):
+            y = f(a)
             assert isinstance(y, Result), y
-            return reduce(g, tail, y)
+            if first is None:
+                first = y
+            if isinstance(y.get, NonemptyList):
+                parses.extend(_to_list(y.get))
+        assert first is not None
+        return Result(_from_list(parses)) if parses else first
 
     @classmethod
     def return_(cls: "Type[Result[A]]", a: A) -> "Result[A]":